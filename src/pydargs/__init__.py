@@ -1,14 +1,28 @@
+import re
 import sys
-from argparse import ArgumentParser, BooleanOptionalAction, Namespace, SUPPRESS
-from collections.abc import Sequence
+from argparse import (
+    Action,
+    ArgumentError,
+    ArgumentParser,
+    BooleanOptionalAction,
+    Namespace,
+    SUPPRESS,
+    _StoreAction,
+    _SubParsersAction,
+)
+from collections.abc import Mapping, Sequence
 from dataclasses import Field, MISSING, fields
-from datetime import date, datetime
-from enum import Enum
-from pathlib import Path
+from enum import Enum, EnumMeta
+from functools import cache, partial
+from types import MappingProxyType
 from typing import (
     Any,
+    Callable,
     ClassVar,
+    IO,
+    TYPE_CHECKING,
     Literal,
+    NamedTuple,
     Optional,
     Protocol,
     Type,
@@ -16,16 +30,39 @@ from typing import (
     Union,
     get_origin,
     get_args,
+    get_type_hints,
 )
 from warnings import warn
+from weakref import WeakKeyDictionary
+
+from pydargs.utils import rename, yaml_available
 
-from pydargs.utils import named_partial, rename, yaml_available
+if TYPE_CHECKING:
+    from datetime import date, datetime
+    from pathlib import Path
 
-UNION_TYPES: set[Any] = {Union}
-if sys.version_info >= (3, 10):
+try:
     from types import UnionType
 
-    UNION_TYPES.add(UnionType)
+    UNION_TYPES: frozenset[Any] = frozenset({Union, UnionType})
+except ImportError:  # Python < 3.10
+    UNION_TYPES = frozenset({Union})
+
+
+class _FactoryDefault:
+    """Placeholder default of positional arguments with a default factory.
+
+    Parsers are cached and reused, so the factory is left to the dataclass, which calls it upon instantiation.
+    """
+
+    def __repr__(self) -> str:
+        return "<factory>"  # Shown as the default in help messages, as in the repr of dataclass fields
+
+
+_FACTORY_DEFAULT = _FactoryDefault()
+
+_DASHES = str.maketrans("_", "-")
+_DEFAULT_HELP = "(default: %s)"
 
 
 class DataClassProtocol(Protocol):
@@ -40,9 +77,12 @@ def parse(
 ) -> Dataclass:
     """Instantiate an object of the provided dataclass type from command line arguments.
 
+    The ArgumentParser is built once per dataclass type and keyword arguments, and reused for
+    subsequent calls. Call `parse.cache_clear()` to discard the cached parsers.
+
     Args:
         tp: Type of the object to instantiate. This is expected to be a dataclass.
-        args: Optional list of arguments. Defaults to sys.argv.
+        args: Optional list of arguments. Defaults to sys.argv[1:], i.e. without the program name.
         add_config_file_argument: If True, add a --config-file argument to load allow loading
             defaults from a JSON- or YAML-formatted file.
         **kwargs: Keyword arguments passed to the ArgumentParser object.
@@ -50,15 +90,15 @@ def parse(
     Returns:
         An instance of tp.
     """
-    namespace = _create_parser(tp, add_config_file_argument=add_config_file_argument, **kwargs).parse_args(args)
+    namespace = _parse_args(_create_parser(tp, add_config_file_argument=add_config_file_argument, **kwargs), args)
     if add_config_file_argument:
         _add_defaults_from_file(namespace)
-    result = _create_object(tp, namespace)
-    if len(namespace.__dict__):
+    values = vars(namespace)
+    result = _create_object(tp, values)
+    if values:
         if add_config_file_argument:
             warn(
-                "The following keys from the provided configuration file were "
-                f"not consumed: {', '.join(namespace.__dict__.keys())}"
+                f"The following keys from the provided configuration file were not consumed: {', '.join(values.keys())}"
             )
         else:
             raise RuntimeError("Internal pydargs error: Some namespace arguments have not been consumed.")
@@ -67,30 +107,42 @@ def parse(
 
 def _add_defaults_from_file(namespace: Namespace, key: str = "config_file") -> None:
     """Read defaults from the config file argument."""
-    if key in namespace:
-        file_path: Path = getattr(namespace, key)
+    values = vars(namespace)
+    if key in values:
+        file_path: "Path" = values.pop(key)
         if file_path.suffix in (".yaml", ".yml"):
             if not yaml_available():
                 raise RuntimeError(
                     "PyYAML is required to parse YAML files. "
                     "To install PyYAML with pydargs, run `pip install pydargs[yaml]`."
                 )
-            from yaml import safe_load
-
-            defaults = safe_load(file_path.read_text())
+            with file_path.open("rb") as stream:
+                defaults = _yaml_loader()(stream)
         else:
             from json import loads as load
 
             defaults = load(file_path.read_text())
-        delattr(namespace, key)
         _add_defaults_from_dict(namespace, defaults)
 
 
+@cache
+def _yaml_loader() -> Callable[[IO[bytes]], Any]:
+    """Return a function that safely loads YAML, using the LibYAML bindings if available."""
+    from yaml import load
+
+    try:  # The LibYAML bindings are much faster than the pure Python loader
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader  # type: ignore
+
+    return partial(load, Loader=SafeLoader)
+
+
 def _add_defaults_from_dict(namespace: Namespace, defaults: dict[str, Any]) -> None:
     """Add keys from a dictionary to a namespace if they do not yet exist."""
+    values = vars(namespace)
     for key, value in _flatten_dict(defaults).items():
-        if not hasattr(namespace, key):
-            setattr(namespace, key, value)
+        values.setdefault(key, value)
 
 
 def _flatten_dict(input_dict: dict[str, Any], prefix: str = "") -> dict[str, Any]:
@@ -108,59 +160,98 @@ def _flatten_dict(input_dict: dict[str, Any], prefix: str = "") -> dict[str, Any
     Returns:
         Flattened dictionary.
     """
-    result = {}
-    for key, value in input_dict.items():
-        if isinstance(value, dict):
-            for n_key, n_value in _flatten_dict(value, prefix=f"{key}_").items():
-                if prefix + n_key in result:
-                    raise KeyError(f"Collision between keys in config file on key {prefix + n_key}.")
-                result[prefix + n_key] = n_value
+    result: dict[str, Any] = {}
+    # Walk the nested dictionaries depth-first, keeping the prefix and the remaining items of each level on a stack.
+    stack = [(prefix, iter(input_dict.items()))]
+    while stack:
+        key_prefix, items = stack[-1]
+        for key, value in items:
+            if isinstance(value, dict):
+                stack.append((f"{key_prefix}{key}_", iter(value.items())))
+                break
+            key = key_prefix + key
+            if key in result:
+                raise KeyError(f"Collision between keys in config file on key {key}.")
+            result[key] = value
         else:
-            if prefix + key in result:
-                raise KeyError(f"Collision between keys in config file on key {prefix + key}.")
-            result[prefix + key] = value
+            stack.pop()
     return result
 
 
-def _create_object(tp: Type[Dataclass], namespace: Namespace, prefix: str = "") -> Dataclass:
-    for field in fields(tp):
-        if hasattr(field.type, "__dataclass_fields__"):
+def _create_object(tp: Type[Dataclass], values: dict[str, Any], prefix: str = "") -> Dataclass:
+    """Instantiate a dataclass from the values of a parsed namespace, removing the values that are consumed."""
+    for field, key, nested_prefix, is_command in _nested_fields(tp, prefix):
+        if not is_command:
             # Create nested dataclass object
-            setattr(
-                namespace,
-                prefix + field.name,
-                _create_object(field.type, namespace, prefix=f"{prefix}{field.name}_"),
-            )
-        elif _is_command(field):
-            chosen_command = getattr(namespace, prefix + field.name)
+            values[key] = _create_object(field.type, values, prefix=nested_prefix)
+        else:
             # Remove chosen command name and optionally replace with instantiated object.
-            delattr(namespace, prefix + field.name)
+            chosen_command = values.pop(key)
             if chosen_command is not None:
-                for arg in get_args(field.type):
-                    if arg.__name__ == chosen_command:
-                        setattr(
-                            namespace,
-                            prefix + field.name,
-                            _create_object(arg, namespace, prefix=f"{prefix}{field.name}_"),
-                        )
-                        break
-                if not hasattr(namespace, prefix + field.name):
+                if (command := _commands(field).get(chosen_command)) is None:
                     raise ValueError("Invalid command.", chosen_command)
-    # Select the relevant keys for the object and remove prefixes.
-    args = {
-        key[len(prefix) :]: value
-        for key, value in namespace.__dict__.items()
-        if key.startswith(prefix) and key[len(prefix) :] in {field.name for field in fields(tp)}
-    }
-    # Remove the keys used so far from the namespace, to prevent clutter when creating a parent object.
-    for key in args.keys():
-        delattr(namespace, prefix + key)
-    return tp(**args)
+                values[key] = _create_object(command, values, prefix=nested_prefix)
+    # Pass the values of the fields by keyword, as the order of the fields need not match the __init__ signature.
+    # Keys are removed from the values, to prevent clutter when creating a parent object.
+    keyword_args: dict[str, Any] = {}
+    for name, key in _init_fields(tp, prefix):
+        value = values.pop(key, _FACTORY_DEFAULT)
+        if value is not _FACTORY_DEFAULT:
+            keyword_args[name] = value
+    return tp(**keyword_args)
+
+
+@cache
+def _fields(tp: Type[Dataclass]) -> tuple[Field, ...]:
+    """Return the fields of a dataclass, with string annotations resolved into types."""
+    result = fields(tp)
+    if not any(isinstance(field.type, str) for field in result):
+        return result
+    from copy import copy
+
+    type_hints = get_type_hints(tp)
+    resolved = []
+    for field in result:
+        if isinstance(field.type, str):
+            field = copy(field)
+            field.type = type_hints[field.name]
+        resolved.append(field)
+    return tuple(resolved)
+
+
+@cache
+def _nested_fields(tp: Type[Dataclass], prefix: str) -> tuple[tuple[Field, str, str, bool], ...]:
+    """Return the nested dataclass and command fields of a dataclass.
+
+    Each field is returned with its key in the namespace, the prefix of its own keys and whether it is a command.
+    """
+    return tuple(
+        (field, prefix + field.name, f"{prefix}{field.name}_", _is_command(field))
+        for field in _fields(tp)
+        if hasattr(field.type, "__dataclass_fields__") or _is_command(field)
+    )
+
+
+@cache
+def _init_fields(tp: Type[Dataclass], prefix: str) -> tuple[tuple[str, str], ...]:
+    """Return the name and namespace key of each __init__ field of a dataclass."""
+    return tuple((field.name, prefix + field.name) for field in _fields(tp) if field.init)
 
 
 def _create_parser(tp: Type[Dataclass], add_config_file_argument: bool, **kwargs: Any) -> ArgumentParser:
+    try:
+        hash(tuple(kwargs.values()))
+    except TypeError:  # Parsers created with unhashable arguments, e.g. parents, can not be cached.
+        return _build_parser(tp, add_config_file_argument, **kwargs)
+    # Sort the keyword arguments, so the order in which they are passed does not affect the cache key.
+    return _build_cached_parser(tp, add_config_file_argument, **dict(sorted(kwargs.items())))
+
+
+def _build_parser(tp: Type[Dataclass], add_config_file_argument: bool, **kwargs: Any) -> ArgumentParser:
     parser = ArgumentParser(**kwargs, argument_default=SUPPRESS)
     if add_config_file_argument:
+        from pathlib import Path
+
         supported_types = "JSON- or YAML-" if yaml_available() else "JSON-"
         parser.add_argument(
             "--config-file",
@@ -172,30 +263,180 @@ def _create_parser(tp: Type[Dataclass], add_config_file_argument: bool, **kwargs
     return parser
 
 
+_build_cached_parser = cache(_build_parser)
+
+
+def _cache_clear() -> None:
+    _build_cached_parser.cache_clear()
+    _fields.cache_clear()
+    _nested_fields.cache_clear()
+    _init_fields.cache_clear()
+    _is_command.cache_clear()
+    _commands.cache_clear()
+    _is_enum.cache_clear()
+    _datetime_parser.cache_clear()
+    _union_parser.cache_clear()
+    _literal_parser.cache_clear()
+    _enum_parser.cache_clear()
+    _bytes_parser.cache_clear()
+    _compile_arguments.cache_clear()
+
+
+setattr(parse, "cache_clear", _cache_clear)
+
+
+def _parse_args(parser: ArgumentParser, args: Optional[list[str]]) -> Namespace:
+    """Parse arguments, bypassing argparse where the arguments allow.
+
+    Arguments consisting only of exact option strings, each followed by its values or being a flag, are parsed
+    directly, as is an empty list of arguments. Anything else, such as help, abbreviations, positional arguments or
+    invalid values, is left to argparse.
+    """
+    if args is None:
+        args = sys.argv[1:]
+    namespace = _parse_args_directly(parser, args) if args else _parse_no_args(parser)
+    return parser.parse_args(args) if namespace is None else namespace
+
+
+def _parse_no_args(parser: ArgumentParser) -> Optional[Namespace]:
+    """Return the namespace argparse would return for an empty list of arguments.
+
+    Returns None if an argument is required, a default is invalid or the parser has arguments not created by pydargs.
+    """
+    namespace, after_subparsers = Namespace(), False
+    for action in parser._actions:
+        if action.required:
+            return None
+        if action.default is SUPPRESS:
+            continue
+        if type(action) is _SubParsersAction:
+            setattr(namespace, action.dest, action.default)
+            after_subparsers = True
+        elif (
+            type(action) is _StoreAction and not action.option_strings and action.nargs == "?" and not after_subparsers
+        ):
+            # Optional positional arguments take their default, which argparse converts if it is a string
+            value = action.default
+            if isinstance(value, str):
+                try:
+                    value = parser._get_value(action, value)
+                    parser._check_value(action, value)
+                except ArgumentError:
+                    return None
+            setattr(namespace, action.dest, value)
+        else:
+            return None
+    return namespace
+
+
+def _parse_args_directly(parser: ArgumentParser, args: list[str]) -> Optional[Namespace]:
+    if (actions := _direct_actions(parser)) is None:
+        return None
+    namespace, seen, index = Namespace(), set(), 0
+    while index < len(args):
+        if (action := actions.get(args[index])) is None:
+            return None
+        if action.nargs == 0:  # A flag
+            action(parser, namespace, None, args[index])
+            index += 1
+        else:
+            # Consume one value, or all values up to the next option for lists
+            end = index + 1
+            while end < len(args) and not args[end].startswith("-") and (action.nargs is not None or end == index + 1):
+                end += 1
+            if end == index + 1:
+                return None
+            try:
+                values = [parser._get_value(action, arg) for arg in args[index + 1 : end]]
+                for value in values:
+                    parser._check_value(action, value)
+            except ArgumentError:
+                return None
+            setattr(namespace, action.dest, values if action.nargs is not None else values[0])
+            index = end
+        seen.add(action)
+    if any(action.required and action not in seen for action in parser._actions):
+        return None
+    return namespace
+
+
+_DIRECT_ACTIONS: "WeakKeyDictionary[ArgumentParser, Optional[dict[str, Action]]]" = WeakKeyDictionary()
+
+
+def _direct_actions(parser: ArgumentParser) -> Optional[dict[str, Action]]:
+    """Map the option strings of a parser to actions that can be parsed directly.
+
+    Returns None if the parser has positional arguments, subparsers, defaults or a non-standard syntax.
+    """
+    if parser not in _DIRECT_ACTIONS:
+        eligible = (
+            parser.prefix_chars == "-"
+            and parser.fromfile_prefix_chars is None
+            and not parser._mutually_exclusive_groups
+            and all(action.option_strings and action.default is SUPPRESS for action in parser._actions)
+        )
+        _DIRECT_ACTIONS[parser] = (
+            {
+                option: action
+                for action in parser._actions
+                if (type(action) is _StoreAction and action.nargs in (None, "*", "+"))
+                or type(action) is BooleanOptionalAction
+                for option in action.option_strings
+            }
+            if eligible
+            else None
+        )
+    return _DIRECT_ACTIONS[parser]
+
+
+class _Argument(NamedTuple):
+    """Positional and keyword arguments of a single call to add_argument."""
+
+    args: tuple[str, ...]
+    kwargs: Mapping[str, Any]  # Read-only, as the compiled arguments are cached and shared between parsers
+
+
 def _add_arguments(
     parser: ArgumentParser, tp: Type[Dataclass], arg_prefix: str = "", dest_prefix: str = ""
 ) -> ArgumentParser:
     parser_or_group = (  # Only add a group if there is a arg_prefix that isn't "".
         parser.add_argument_group(arg_prefix.strip("_")) if arg_prefix else parser
     )
+    add_argument = parser_or_group.add_argument
+    for spec in _compile_arguments(tp, arg_prefix, dest_prefix):
+        if isinstance(spec, _Argument):
+            add_argument(*spec.args, **spec.kwargs)
+        elif _is_command(spec):
+            _add_subparsers(parser, spec, dest_prefix)
+        else:
+            # Recursively add arguments for the nested dataclasses
+            _add_arguments(parser, spec.type, f"{arg_prefix}{spec.name}_", f"{dest_prefix}{spec.name}_")
+    return parser
+
+
+@cache
+def _compile_arguments(tp: Type[Dataclass], arg_prefix: str, dest_prefix: str) -> tuple[Union[_Argument, Field], ...]:
+    """Compile the fields of a dataclass into arguments.
+
+    Nested dataclass and command fields are returned as is, to be added by _add_arguments.
+    """
+    result: list[Union[_Argument, Field]] = []
     has_subparser = False
-    for field in fields(tp):
+    for field in _fields(tp):
         if field.metadata.get("ignore_arg", False):
             continue
         if field.init is False:
             continue
         if _is_command(field):
-            _add_subparsers(parser, field, dest_prefix)
+            result.append(field)
             has_subparser = True
             continue
 
         argument_kwargs: dict[str, Any] = dict()
-        field_has_default = field.default is not MISSING or field.default_factory is not MISSING
-        argument_kwargs["help"] = field.metadata.get("help", "")
-        if field.default is not MISSING:
-            if len(argument_kwargs["help"]):
-                argument_kwargs["help"] += " "
-            argument_kwargs["help"] += f"(default: {field.default})"
+        field_has_default = _has_default(field)
+        argument_kwargs["help"] = _help(field)
+        name = arg_prefix + field.name
+        dest = sys.intern(dest_prefix + field.name)
         positional = field.metadata.get("positional", False)
         short_option = field.metadata.get("short_option")
         if positional:
@@ -203,56 +444,38 @@ def _add_arguments(
                 warn("Positional arguments defined after a subparser cannot be parsed.")
             if short_option:
                 raise ValueError("Short options are not supported for positional arguments.")
-            arguments = [dest_prefix + field.name]
+            arguments = [dest]
             if field_has_default:
                 # Positional arguments that are not required must have a valid default
-                argument_kwargs["default"] = (
-                    field.default_factory()  # This is safe only because the parser is only used once.
-                    if field.default_factory is not MISSING
-                    else field.default
-                )
+                argument_kwargs["default"] = _FACTORY_DEFAULT if field.default_factory is not MISSING else field.default
                 argument_kwargs["nargs"] = "?"
-            argument_kwargs["metavar"] = field.metadata.get("metavar", (arg_prefix + field.name))
+            argument_kwargs["metavar"] = field.metadata.get("metavar", name)
 
         else:
-            arguments = [f"--{(arg_prefix + field.name).replace('_', '-')}"]
+            arguments = [sys.intern("--" + name.translate(_DASHES))]
             if short_option:
                 arguments = [short_option] + arguments
-            argument_kwargs["dest"] = dest_prefix + field.name
-            argument_kwargs["metavar"] = field.metadata.get("metavar", (arg_prefix + field.name).upper())
+            argument_kwargs["dest"] = dest
+            argument_kwargs["metavar"] = field.metadata.get("metavar", name.upper())
             argument_kwargs["required"] = not field_has_default
 
         if parser_fct := field.metadata.get("parser", None):
-            parser_or_group.add_argument(
-                *arguments,
-                type=parser_fct,
-                **argument_kwargs,
-            )
+            argument_kwargs["type"] = parser_fct
         elif origin := get_origin(field.type):
+            type_args = get_args(field.type)
             if origin is Sequence or origin is list:
                 argument_kwargs["nargs"] = "*" if field_has_default else "+"
-                parser_or_group.add_argument(
-                    *arguments,
-                    type=get_args(field.type)[0],
-                    **argument_kwargs,
-                )
+                argument_kwargs["type"] = type_args[0]
             elif origin is Literal:
-                if len({type(arg) for arg in get_args(field.type)}) > 1:
+                literal_type: Any = type(type_args[0])
+                if any(type(arg) is not literal_type for arg in type_args[1:]):
                     raise NotImplementedError("Parsing Literals with mixed types is not supported.")
                 if "metavar" not in field.metadata:
                     del argument_kwargs["metavar"]  # Remove default metavar in favour of argparse default
-                parser_or_group.add_argument(
-                    *arguments,
-                    choices=get_args(field.type),
-                    type=type(get_args(field.type)[0]),
-                    **argument_kwargs,
-                )
+                argument_kwargs["choices"] = type_args
+                argument_kwargs["type"] = _literal_parser(literal_type, type_args)
             elif origin in UNION_TYPES:
-                parser_or_group.add_argument(
-                    *arguments,
-                    type=named_partial(_parse_union, _display_name=repr(field.type), union_type=field.type),
-                    **argument_kwargs,
-                )
+                argument_kwargs["type"] = _union_parser(type_args, repr(field.type))
             else:
                 raise NotImplementedError(f"Parsing into type {origin} is not implemented.")
         elif hasattr(field.type, "__dataclass_fields__"):
@@ -260,60 +483,30 @@ def _add_arguments(
                 raise ValueError("Dataclasses may not be positional arguments.")
             if field_has_default and field.default_factory != field.type:
                 warn(f"Non-standard default of field {field.name} is ignored by pydargs.", UserWarning)
-            # Recursively add arguments for the nested dataclasses
-            _add_arguments(parser, field.type, f"{arg_prefix}{field.name}_", f"{dest_prefix}{field.name}_")
-        elif field.type in (date, datetime):
-            parser_or_group.add_argument(
-                *arguments,
-                type=named_partial(
-                    _parse_datetime,
-                    _display_name=str(field.type),
-                    is_date=field.type is date,
-                    date_format=field.metadata.get("date_format"),
-                ),
-                **argument_kwargs,
-            )
-        elif field.type is bool:
-            if field.metadata.get("as_flags", False):
-                if positional:
-                    raise ValueError("A field cannot be positional as well as be represented by flags.")
-                parser_or_group.add_argument(*arguments, action=BooleanOptionalAction, **argument_kwargs)
-            else:
-                parser_or_group.add_argument(
-                    *arguments,
-                    type=_parse_bool,
-                    **argument_kwargs,
-                )
-        elif issubclass(field.type, Enum):
+            result.append(field)
+            continue
+        elif field.type is bool and field.metadata.get("as_flags", False):
+            if positional:
+                raise ValueError("A field cannot be positional as well as be represented by flags.")
+            argument_kwargs["action"] = BooleanOptionalAction
+        elif converter := _converter(field.type):
+            argument_kwargs["type"] = converter(field)
+        elif _is_enum(field.type):
             if "metavar" not in field.metadata:
                 del argument_kwargs["metavar"]  # Remove default metavar in favour of argparse default
-            parser_or_group.add_argument(
-                *arguments,
-                choices=list(field.type),
-                type=named_partial(_parse_enum_key, _display_name=field.type.__name__, enum_type=field.type),
-                **argument_kwargs,
-            )
-        elif field.type is bytes:
-            encoding = field.metadata.get("encoding", "utf-8")
-            parser_or_group.add_argument(
-                *arguments,
-                type=named_partial(field.type, _display_name=encoding, encoding=encoding),
-                **argument_kwargs,
-            )
+            argument_kwargs["choices"] = tuple(field.type)
+            argument_kwargs["type"] = _enum_parser(field.type)
         else:
-            parser_or_group.add_argument(
-                *arguments,
-                type=field.type,
-                **argument_kwargs,
-            )
-    return parser
+            argument_kwargs["type"] = field.type
+        result.append(_Argument(tuple(arguments), MappingProxyType(argument_kwargs)))
+    return tuple(result)
 
 
 def _add_subparsers(parser: ArgumentParser, field: Field, dest_prefix: str) -> None:
     subparsers = parser.add_subparsers(
-        dest=dest_prefix + field.name,
+        dest=sys.intern(dest_prefix + field.name),
         title=field.name,
-        required=field.default is MISSING and field.default_factory is MISSING,
+        required=not _has_default(field),
         help=field.metadata.get("help"),
     )
 
@@ -327,6 +520,21 @@ def _add_subparsers(parser: ArgumentParser, field: Field, dest_prefix: str) -> N
         _add_arguments(subparser, command, arg_prefix="", dest_prefix=f"{dest_prefix}{field.name}_")
 
 
+def _help(field: Field) -> str:
+    """Return the help message of a field, followed by its default if it has one."""
+    help_message = field.metadata.get("help", "")
+    if field.default is MISSING:
+        return help_message
+    # Escape the default, as argparse applies %-formatting to help messages.
+    default_message = _DEFAULT_HELP % format(field.default).replace("%", "%%")
+    return f"{help_message} {default_message}" if help_message else default_message
+
+
+def _has_default(field: Field) -> bool:
+    return field.default is not MISSING or field.default_factory is not MISSING
+
+
+@cache
 def _is_command(field: Field) -> bool:
     # A command is a Union of dataclass fields.
     return get_origin(field.type) in UNION_TYPES and all(
@@ -334,36 +542,185 @@ def _is_command(field: Field) -> bool:
     )
 
 
+@cache
+def _commands(field: Field) -> dict[str, Type[Any]]:
+    """Map the names and aliases of the commands of a command field to their dataclasses."""
+    return {name: command for command in get_args(field.type) for name in (command.__name__, command.__name__.lower())}
+
+
+@cache
+def _is_enum(tp: Any) -> bool:
+    return isinstance(tp, EnumMeta)
+
+
+_BOOLEANS = {
+    "true": True,
+    "True": True,
+    "TRUE": True,
+    "1": True,
+    "false": False,
+    "False": False,
+    "FALSE": False,
+    "0": False,
+}
+
+
 @rename(name="bool")
 def _parse_bool(arg: str) -> bool:
-    if arg.lower() == "true" or arg == "1":
-        return True
-    elif arg.lower() == "false" or arg == "0":
-        return False
-    raise TypeError(f"Unable to convert {arg} to boolean.")
+    # Look up the common spellings as is, and only lowercase the argument if that fails.
+    if (value := _BOOLEANS.get(arg)) is None and (value := _BOOLEANS.get(arg.lower())) is None:
+        raise TypeError(f"Unable to convert {arg} to boolean.")
+    return value
 
 
-def _parse_datetime(date_string: str, is_date: bool, date_format: Optional[str] = None) -> Union[date, datetime]:
-    result = datetime.strptime(date_string, date_format) if date_format else datetime.fromisoformat(date_string)
-    return result.date() if is_date else result
+# Formats for which values in this strict layout are parsed with the same result by the faster fromisoformat.
+_ISO_FORMAT_PATTERNS = {
+    "%Y-%m-%d": re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}"),
+    "%Y-%m-%dT%H:%M:%S": re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}"),
+    "%Y-%m-%d %H:%M:%S": re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}"),
+}
 
 
-def _parse_enum_key(key: str, enum_type: Type[Enum]) -> Enum:
-    try:
-        return enum_type[key]
-    except KeyError:
-        raise TypeError
+@cache
+def _datetime_parser(is_date: bool, date_format: Optional[str]) -> Callable[[str], Union["date", "datetime"]]:
+    # Return a parser specialized for the combination of type and format, to avoid branching on every value.
+    from datetime import date, datetime
 
+    fmt = date_format or ""
+    pattern = _ISO_FORMAT_PATTERNS.get(fmt)
 
-def _parse_union(value: str, union_type: Type) -> Any:
-    for arg in get_args(union_type):
-        if isinstance(None, arg):
-            continue
+    def parse_iso(date_string: str) -> "datetime":
+        return datetime.fromisoformat(date_string)
+
+    def parse_formatted(date_string: str) -> "datetime":
+        return datetime.strptime(date_string, fmt)
+
+    def parse_iso_formatted(date_string: str) -> "datetime":
+        if pattern is not None and pattern.fullmatch(date_string):
+            return datetime.fromisoformat(date_string)
+        return datetime.strptime(date_string, fmt)
+
+    parse_datetime = parse_formatted if fmt else parse_iso
+    if pattern is not None:
+        parse_datetime = parse_iso_formatted
+    if not is_date:
+        return rename(str(datetime))(parse_datetime)
+
+    def parse_date(date_string: str) -> "date":
+        return parse_datetime(date_string).date()
+
+    return rename(str(date))(parse_date)
+
+
+@cache
+def _literal_parser(literal_type: Any, choices: tuple[Any, ...]) -> Callable[[str], Any]:
+    # Return choices by their string representation directly, and only convert other values to the type of the
+    # choices, to be rejected or accepted by the argparse choices check. The type is part of the cache key, as
+    # e.g. (1,) == (True,).
+    lookup = {str(choice): choice for choice in choices}
+
+    def parse_literal(value: str) -> Any:
+        return lookup[value] if value in lookup else literal_type(value)
+
+    return rename(literal_type.__name__)(parse_literal)
+
+
+@cache
+def _enum_parser(enum_type: Type[Enum]) -> Callable[[str], Enum]:
+    # Look up members by name directly, raising a TypeError that argparse reports as an invalid value.
+    members = enum_type.__members__
+
+    @rename(enum_type.__name__)
+    def parse_enum_key(key: str) -> Enum:
         try:
-            return arg(value)
-        except ValueError:
-            continue
-    raise ValueError(f"Unable to parse '{value}' as one of {union_type}")
+            return members[key]
+        except KeyError:
+            raise TypeError
+
+    return parse_enum_key
+
+
+_WHITESPACE = r"[\t\n\x0b\x0c\r ]*"
+_DIGITS = r"[0-9](?:_?[0-9])*"
+# Patterns matching exactly the ASCII strings accepted by int and float.
+_NUMBER_PATTERNS = {
+    int: re.compile(f"{_WHITESPACE}[+-]?{_DIGITS}{_WHITESPACE}"),
+    float: re.compile(
+        f"{_WHITESPACE}[+-]?(?:(?:{_DIGITS}(?:\\.(?:{_DIGITS})?)?|\\.{_DIGITS})(?:e[+-]?{_DIGITS})?|inf(?:inity)?|nan)"
+        f"{_WHITESPACE}",
+        re.IGNORECASE,
+    ),
+}
+
+
+def _parameterized_union_member(value: str) -> Any:
+    # Parameterized members, such as list[int], can not be created from a single value. Raise a TypeError, which
+    # argparse reports as an invalid value.
+    raise TypeError
+
+
+@cache
+def _union_parser(union_args: tuple[Any, ...], name: str) -> Callable[[str], Any]:
+    # Determine the members to try once, rather than skipping None for every value. Numeric members are skipped
+    # when an ASCII value that is not just digits does not match their pattern, which is cheaper than raising and
+    # catching a ValueError. The name is part of the cache key, as e.g. Optional[int] and int | None have equal args.
+    members = tuple(
+        (_parameterized_union_member if get_origin(arg) else arg, _NUMBER_PATTERNS.get(arg))
+        for arg in union_args
+        if arg is not type(None)
+    )
+
+    def parse_union(value: str) -> Any:
+        check = value.isascii() and not value.isdigit()
+        for member, pattern in members:
+            if check and pattern is not None and pattern.fullmatch(value) is None:
+                continue
+            try:
+                return member(value)
+            except ValueError:
+                continue
+        raise ValueError(f"Unable to parse '{value}' as one of {name}")
+
+    return rename(name)(parse_union)
+
+
+def _datetime_converter(field: Field) -> Callable[[str], Union["date", "datetime"]]:
+    from datetime import date
+
+    return _datetime_parser(is_date=field.type is date, date_format=field.metadata.get("date_format"))
+
+
+def _bytes_converter(field: Field) -> Callable[[str], bytes]:
+    return _bytes_parser(field.metadata.get("encoding", "utf-8"))
+
+
+@cache
+def _bytes_parser(encoding: str) -> Callable[[str], bytes]:
+    def parse_bytes(value: str) -> bytes:
+        return value.encode(encoding)
+
+    return rename(encoding)(parse_bytes)
+
+
+# Factories of the argparse type converter of fields, by field type, for types that are not used as is.
+# Converters of date and datetime fields are added by _converter, to avoid importing datetime when unused.
+_CONVERTERS: dict[Any, Callable[[Field], Callable[[str], Any]]] = {
+    bool: lambda field: _parse_bool,
+    bytes: _bytes_converter,
+}
+
+
+def _converter(tp: Any) -> Optional[Callable[[Field], Callable[[str], Any]]]:
+    """Return the factory of the argparse type converter for a field type, if the type is not used as is."""
+    if tp in _CONVERTERS:
+        return _CONVERTERS[tp]
+    # The datetime module is only imported when needed; fields can only be of its types once it has been imported.
+    if "datetime" in sys.modules:
+        from datetime import date, datetime
+
+        if tp is date or tp is datetime:
+            return _datetime_converter
+    return None
 
 
 __all__ = ["parse"]
@@ -1,17 +1,9 @@
-from functools import cache, partial
-from importlib.util import find_spec
-from typing import Any, Callable, TypeVar
+from functools import cache
+from typing import Callable, TypeVar
 
 Fct = TypeVar("Fct")
 
 
-def named_partial(func: Callable[..., Any], *, _display_name: str, **kwargs) -> Callable[[str], Any]:
-    # Wrapper around partial to give it a name, for argparse to provide meaningful messages
-    result = partial(func, **kwargs)
-    setattr(result, "__name__", _display_name)
-    return result
-
-
 def rename(name: str) -> Callable[[Fct], Fct]:
     # Function decorator to give a function a specific name, for argparse to provide meaningful messages
     def wrapper(f: Fct) -> Fct:
@@ -23,4 +15,6 @@ def rename(name: str) -> Callable[[Fct], Fct]:
 
 @cache
 def yaml_available() -> bool:
+    from importlib.util import find_spec
+
     return find_spec("yaml") is not None
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from enum import Enum
+from typing import Literal, Optional, Union
+
+from pydargs import parse
+
+
+class AnEnum(Enum):
+    one = 1
+    two = 2
+
+
+@dataclass
+class SubConfig:
+    b: Optional[int] = None
+
+
+@dataclass
+class Command:
+    c: date = date(2000, 1, 1)
+
+
+@dataclass
+class Config:
+    command: Union[Command, SubConfig]
+    a: bool = False
+    e: AnEnum = AnEnum.one
+    f: bool = field(default=False, metadata=dict(as_flags=True))
+    numbers: list[int] = field(default_factory=list)
+    lit: Literal["x", "y"] = "x"
+    sub: SubConfig = field(default_factory=SubConfig)
+
+
+class TestPostponedAnnotations:
+    def test_defaults(self) -> None:
+        assert parse(Config, ["Command"]) == Config(command=Command())
+
+    def test_values(self) -> None:
+        args = ["--a", "true", "--e", "two", "--f", "--numbers", "1", "2", "--lit", "y", "--sub-b", "3"]
+        config = parse(Config, args + ["Command", "--c", "2001-02-03"])
+        assert config == Config(
+            command=Command(c=date(2001, 2, 3)),
+            a=True,
+            e=AnEnum.two,
+            f=True,
+            numbers=[1, 2],
+            lit="y",
+            sub=SubConfig(b=3),
+        )
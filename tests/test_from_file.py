@@ -8,7 +8,7 @@ from yaml import dump
 
 from pytest import raises, warns
 
-from pydargs import parse
+from pydargs import _flatten_dict, parse
 
 
 @dataclass
@@ -126,3 +126,14 @@ class TestFileCollision:
     def test_parse_with_file(self, tmp_path: Path) -> None:
         with raises(ArgumentError):
             parse(self.Config, [], add_config_file_argument=True)
+
+
+class TestFlattenDict:
+    def test_flatten(self) -> None:
+        flat = _flatten_dict({"a": 1, "b": {"c": 2, "d": [1, 2, 3], "e": {"f": 1, "g": {"h": 4}}}, "i": {}, "j": 5})
+        assert list(flat.items()) == [("a", 1), ("b_c", 2), ("b_d", [1, 2, 3]), ("b_e_f", 1), ("b_e_g_h", 4), ("j", 5)]
+
+    def test_collision(self) -> None:
+        with raises(KeyError) as e:
+            _flatten_dict({"a_b": 1, "a": {"b": 2}})
+        assert str(e.value) == "'Collision between keys in config file on key a_b.'"
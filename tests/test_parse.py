@@ -1,11 +1,12 @@
 import sys
-from dataclasses import dataclass, field
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from dataclasses import InitVar, dataclass, field
 from json import loads
-from typing import Literal, Optional
+from typing import Literal, Optional, Union
 
 from pytest import mark, raises
 
-from pydargs import parse
+from pydargs import _compile_arguments, _create_parser, _parse_args_directly, _parse_no_args, parse
 
 
 class TestParseCustomParser:
@@ -157,6 +158,17 @@ class TestPositional:
         config = parse(Config, [])
         assert config.positional == 123
 
+    def test_positional_default_factory_help(self, capsys) -> None:
+        @dataclass
+        class Config:
+            numbers: list[int] = field(default_factory=lambda: [1], metadata=dict(positional=True, help="numbers"))
+
+        with raises(SystemExit):
+            parse(Config, ["-h"], prog="prog", formatter_class=ArgumentDefaultsHelpFormatter)
+        captured = capsys.readouterr()
+        assert "(default: <factory>)" in captured.out
+        assert "object at" not in captured.out
+
     def test_default_factory_modification(self) -> None:
         @dataclass
         class Config:
@@ -206,6 +218,33 @@ class TestHelp:
         captured = capsys.readouterr()
         assert help_string in captured.out.replace("\n", "")
 
+    def test_help_default_with_percent(self, capsys) -> None:
+        @dataclass
+        class Config:
+            fraction: str = field(default="50%", metadata=dict(help="a fraction"))
+
+        with raises(SystemExit):
+            parse(Config, ["--help"], prog="prog")
+        captured = capsys.readouterr()
+        assert "a fraction (default: 50%)" in captured.out
+
+    def test_help_default_formatted(self, capsys) -> None:
+        class Value(str):
+            def __str__(self) -> str:
+                return "str"
+
+            def __format__(self, format_spec: str) -> str:
+                return "formatted"
+
+        @dataclass
+        class Config:
+            value: str = Value()
+
+        with raises(SystemExit):
+            parse(Config, ["--help"], prog="prog")
+        captured = capsys.readouterr()
+        assert "(default: formatted)" in captured.out
+
     def test_short_option_must_have_dash(self) -> None:
         @dataclass
         class InvalidConfig:
@@ -272,3 +311,185 @@ class TestKwargs:
             parse(self.Config, ["--so", "something_else"], allow_abbrev=False)
         captured = capsys.readouterr()
         assert "error: unrecognized arguments: --so something_else" in captured.err
+
+
+class TestParserCache:
+    @dataclass
+    class Config:
+        a: int = 5
+        positional: list[int] = field(default_factory=lambda: [1], metadata=dict(positional=True))
+
+    def test_parser_reused(self) -> None:
+        parse.cache_clear()  # type: ignore
+        assert _create_parser(self.Config, False) is _create_parser(self.Config, False)
+        assert _create_parser(self.Config, False) is not _create_parser(self.Config, True)
+        assert _create_parser(self.Config, False, prog="a") is not _create_parser(self.Config, False, prog="b")
+        assert _create_parser(self.Config, False, prog="a", allow_abbrev=False) is _create_parser(
+            self.Config, False, allow_abbrev=False, prog="a"
+        )
+
+    def test_arguments_reused(self) -> None:
+        _create_parser(self.Config, False, prog="a")
+        _create_parser(self.Config, False, prog="b")
+        assert _compile_arguments.cache_info().hits > 0
+        assert _compile_arguments(self.Config, "", "") is _compile_arguments(self.Config, "", "")
+
+    def test_arguments_read_only(self) -> None:
+        argument = _compile_arguments(self.Config, "", "")[0]
+        with raises(TypeError):
+            argument.kwargs["required"] = False  # type: ignore
+
+    def test_cache_clear(self) -> None:
+        parser = _create_parser(self.Config, False)
+        parse.cache_clear()  # type: ignore
+        assert _create_parser(self.Config, False) is not parser
+
+    def test_unhashable_kwargs(self) -> None:
+        parent = ArgumentParser(add_help=False)
+        assert _create_parser(self.Config, False, parents=[parent]) is not _create_parser(
+            self.Config, False, parents=[parent]
+        )
+        assert parse(self.Config, ["--a", "1"], parents=[parent]).a == 1
+
+    def test_default_factory_not_shared(self) -> None:
+        config_1 = parse(self.Config, [])
+        config_1.positional.append(2)
+        config_2 = parse(self.Config, [])
+        assert config_2.positional == [1]
+
+
+class TestDirectParsing:
+    @dataclass
+    class Config:
+        a: int
+        b: Literal["x", "y"] = "x"
+        flag: bool = field(default=False, metadata=dict(as_flags=True, short_option="-f"))
+        numbers: list[int] = field(default_factory=list)
+
+    @mark.parametrize(
+        "args, expected",
+        [
+            (["--a", "1"], dict(a=1)),
+            (["--a", "1", "--b", "y", "--a", "2"], dict(a=2, b="y")),
+            (["--no-flag", "--a", "1", "-f"], dict(a=1, flag=True)),
+            (["--a", "1", "--numbers", "1", "2", "-f"], dict(a=1, numbers=[1, 2], flag=True)),
+        ],
+    )
+    def test_direct(self, args: list[str], expected: dict) -> None:
+        namespace = _parse_args_directly(_create_parser(self.Config, False), args)
+        assert namespace is not None
+        assert namespace.__dict__ == expected
+        assert parse(self.Config, args) == self.Config(**expected)
+
+    @mark.parametrize(
+        "args",
+        [
+            [],  # Missing required argument
+            ["--a=1"],
+            ["--a", "-1"],
+            ["--a", "one"],
+            ["--a", "1", "--b", "z"],
+            ["--a", "1", "--numbers"],
+            ["--a", "1", "--numbers", "1", "-2"],
+            ["--a", "1", "--fl"],
+            ["--a"],
+            ["-h"],
+        ],
+    )
+    def test_fallback(self, args: list[str]) -> None:
+        assert _parse_args_directly(_create_parser(self.Config, False), args) is None
+
+    def test_positional(self) -> None:
+        @dataclass
+        class Config:
+            a: int = field(default=1, metadata=dict(positional=True))
+
+        assert _parse_args_directly(_create_parser(Config, False), []) is None
+        assert parse(Config, []).a == 1
+
+
+@dataclass
+class CommandA:
+    a: int = 1
+
+
+@dataclass
+class CommandB:
+    b: int = 2
+
+
+class TestParseNoArgs:
+    @dataclass
+    class Config:
+        a: str = field(default="1", metadata=dict(positional=True))
+        b: int = field(default_factory=lambda: 2, metadata=dict(positional=True))
+        c: Literal["x", "y"] = "x"
+        command: Union[CommandA, CommandB] = field(default_factory=CommandB)
+
+    def test_no_args(self) -> None:
+        parser = _create_parser(self.Config, False)
+        namespace = _parse_no_args(parser)
+        assert namespace is not None
+        assert vars(namespace) == vars(parser.parse_args([]))
+        assert parse(self.Config, []) == self.Config()
+
+    def test_required(self) -> None:
+        @dataclass
+        class Config:
+            a: int = field(metadata=dict(positional=True))
+
+        assert _parse_no_args(_create_parser(Config, False)) is None
+
+    def test_invalid_default(self) -> None:
+        @dataclass
+        class Config:
+            a: Literal["x", "y"] = field(default="z", metadata=dict(positional=True))  # type: ignore
+
+        assert _parse_no_args(_create_parser(Config, False)) is None
+        with raises(SystemExit):
+            parse(Config, [])
+
+
+class TestFieldOrder:
+    def test_missing_before_present(self) -> None:
+        @dataclass
+        class Config:
+            a: int = 1
+            b: str = field(default="b", metadata=dict(ignore_arg=True))
+            c: int = 3
+
+        assert parse(Config, ["--c", "4"]) == Config(a=1, b="b", c=4)
+        assert parse(Config, ["--a", "2"]) == Config(a=2, b="b", c=3)
+
+    @mark.skipif(sys.version_info < (3, 10), reason="keyword-only fields require python3.10")
+    def test_keyword_only(self) -> None:
+        @dataclass(kw_only=True)  # type: ignore
+        class Config:
+            a: int = 1
+            b: int = 2
+
+        assert parse(Config, ["--a", "3", "--b", "4"]) == Config(a=3, b=4)
+
+    def test_init_var(self) -> None:
+        @dataclass
+        class Config:
+            a: int = 1
+            b: InitVar[int] = 0
+            c: int = 3
+
+        config = parse(Config, ["--a", "5", "--c", "7"])
+        assert config.a == 5
+        assert config.c == 7
+
+    def test_custom_init(self) -> None:
+        @dataclass(init=False)
+        class Config:
+            a: int = 1
+            c: int = 3
+
+            def __init__(self, c: int = 3, a: int = 1) -> None:
+                self.a, self.c = a, c
+
+        config = parse(Config, ["--a", "5"])
+        assert config.a == 5
+        assert config.c == 3
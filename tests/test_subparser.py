@@ -96,6 +96,11 @@ class TestParseCommand:
         assert config.command.e == "positional"
         assert config.flag is False
 
+    def test_alias(self):
+        config = parse(self.Config, ["command1", "--a", "12"])
+        assert isinstance(config.command, Command1)
+        assert config.command.a == 12
+
     def test_from_file(self, tmp_path: Path):
         (tmp_path / "config.yaml").write_text(dump({"var": 100, "command": {"b": "b", "c": 0}}))
         with warns(UserWarning) as warnings:
@@ -1,3 +1,4 @@
+from argparse import BooleanOptionalAction
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import date, datetime
@@ -7,7 +8,7 @@ from typing import Optional, Union, Literal
 
 from pytest import mark, raises
 
-from pydargs import parse
+from pydargs import _create_parser, parse
 
 
 class TestBase:
@@ -101,6 +102,17 @@ class TestLiteral:
         captured = capsys.readouterr()
         assert "argument a: invalid choice: 3 " in captured.err
 
+    @mark.parametrize("value, result", [("True", True), ("False", False)])
+    def test_bool(self, value: str, result: bool) -> None:
+        @dataclass
+        class TConfig:
+            a: Literal[True, False] = True
+            b: Literal[1, 0] = 1
+
+        config = parse(TConfig, ["--a", value, "--b", str(int(result))])
+        assert config.a is result
+        assert type(config.b) is int
+
     def test_fail_mixed_types(self):
         @dataclass
         class TConfig:
@@ -199,6 +211,44 @@ class TestUnion:
         config = parse(self.Config, ["--a", "1", "--e", value])  # type: ignore
         assert config.e == result
 
+    @mark.parametrize(
+        "value, result",
+        [(" 1_000 ", 1000), ("-1", -1), ("1e3", 1000.0), ("-.5", -0.5), ("1_0.5", 10.5), ("٣", 3), ("١.٥", 1.5)],
+    )
+    def test_parse_numbers(self, value: str, result: Union[int, float]) -> None:
+        config = parse(self.Config, ["--a", "1", "--e", value])  # type: ignore
+        assert config.e == result
+        assert type(config.e) is type(result)
+
+    def test_parse_union_order(self) -> None:
+        @dataclass
+        class Config:
+            a: Union[int, str] = 0
+            b: Union[str, int] = 0
+
+        config = parse(Config, ["--a", "1", "--b", "1"])
+        assert config.a == 1
+        assert config.b == "1"
+
+    @mark.parametrize("value", ["1__0", "1_", "- 1", "1e", "infinit", "0x10"])
+    def test_parse_numbers_invalid(self, value: str, capsys) -> None:
+        with raises(SystemExit):
+            parse(self.Config, ["--a", "1", "--e", value])
+        captured = capsys.readouterr()
+        assert "argument --e: invalid" in captured.err
+
+    def test_parameterized_member(self, capsys) -> None:
+        @dataclass
+        class Config:
+            a: Optional[list[int]] = None
+            b: Optional[Literal["x", "y"]] = None
+
+        assert parse(Config, []) == Config()
+        with raises(SystemExit):
+            parse(Config, ["--a", "1"])
+        captured = capsys.readouterr()
+        assert "argument --a: invalid typing.Optional[list[int]] value: '1'" in captured.err
+
 
 if version_info >= (3, 10):
 
@@ -247,7 +297,9 @@ class TestBool:
         captured = capsys.readouterr()
         assert "error: the following arguments are required: --a" in captured.err
 
-    @mark.parametrize("arg, value", [("0", False), ("1", True), ("true", True), ("false", False)])
+    @mark.parametrize(
+        "arg, value", [("0", False), ("1", True), ("true", True), ("false", False), ("TRUE", True), ("False", False)]
+    )
     def test_values(self, arg: str, value: bool) -> None:
         config = parse(self.Config, ["--a", arg])  # type: ignore
         assert config.a == value
@@ -282,6 +334,11 @@ class TestBool:
         config = parse(self.Config, ["--a", "false", "-x"])
         assert config.extra is True
 
+    def test_flags_single_action(self) -> None:
+        parser = _create_parser(self.Config, False)
+        assert parser._option_string_actions["--d"] is parser._option_string_actions["--no-d"]
+        assert isinstance(parser._option_string_actions["--d"], BooleanOptionalAction)
+
     def test_flag_argument(self, capsys) -> None:
         with raises(SystemExit):
             parse(self.Config, ["--a", "false", "--e", "invalid"])
@@ -339,6 +396,26 @@ class TestDate:
         config = parse(self.Config, ["--a-date", "2000-01-01", "--a-formatted-datetime", "8/16/1999 23:45"])
         assert config.a_formatted_datetime == datetime(1999, 8, 16, 23, 45)
 
+    @mark.parametrize(
+        "value, result", [("2000-01-02", date(2000, 1, 2)), ("2000-1-2", date(2000, 1, 2)), ("02000-01-02", None)]
+    )
+    def test_iso_date_format(self, value: str, result: Optional[date]) -> None:
+        @dataclass
+        class Config:
+            a: date = field(metadata=dict(date_format="%Y-%m-%d"))
+
+        if result is None:
+            with raises(SystemExit):
+                parse(Config, ["--a", value])
+        else:
+            assert parse(Config, ["--a", value]).a == result
+
+    def test_invalid_format(self, capsys) -> None:
+        with raises(SystemExit):
+            parse(self.Config, ["--a-date", "2000-01-01", "--a-formatted-date", "2000-10-20"])
+        captured = capsys.readouterr()
+        assert "argument --a-formatted-date: invalid <class 'datetime.date'> value: '2000-10-20'" in captured.err
+
 
 class AnIntEnum(Enum):
     one = 1